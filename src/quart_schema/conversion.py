@@ -1,12 +1,35 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from copy import deepcopy
 from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import auto, Enum
+from functools import lru_cache, partial
 from inspect import isclass
-from typing import Any, Dict, List, Literal, Optional, Type, TypeVar, Union
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    get_args,
+    get_origin,
+    get_type_hints,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
 
 import humps
 from quart import current_app
-from quart.typing import HeadersValue, ResponseReturnValue as QuartResponseReturnValue, StatusCode
+from quart.typing import ResponseReturnValue as QuartResponseReturnValue
 from werkzeug.datastructures import Headers
 from werkzeug.exceptions import HTTPException
 
@@ -51,8 +74,14 @@ except ImportError:
 
 
 try:
-    from msgspec import convert, Struct, to_builtins, ValidationError as MsgSpecValidationError
-    from msgspec.json import schema_components
+    from msgspec import (
+        convert,
+        DecodeError as MsgSpecDecodeError,
+        Struct,
+        to_builtins,
+        ValidationError as MsgSpecValidationError,
+    )
+    from msgspec.json import decode as json_decode, schema_components
 except ImportError:
     MSGSPEC_INSTALLED = False
 
@@ -62,10 +91,16 @@ except ImportError:
     def convert(object_: Any, type_: Any) -> Any:  # type: ignore
         raise RuntimeError("Cannot convert, msgspec not installed")
 
+    def json_decode(data: bytes, type: Any) -> Any:  # type: ignore
+        raise RuntimeError("Cannot decode, msgspec not installed")
+
     def to_builtins(object_: Any) -> Any:  # type: ignore
         return object_
 
-    class MsgSpecValidationError(Exception):  # type: ignore
+    class MsgSpecDecodeError(Exception):  # type: ignore
+        pass
+
+    class MsgSpecValidationError(MsgSpecDecodeError):  # type: ignore
         pass
 
 else:
@@ -80,53 +115,62 @@ T = TypeVar("T", bound=Model)
 JsonSchemaMode = Literal["validation", "serialization"]
 
 
+class _DumpStrategy(Enum):
+    MSGSPEC = auto()
+    PASSTHROUGH = auto()
+    PYDANTIC_ADAPTER = auto()
+    PYDANTIC_DATACLASS = auto()
+    PYDANTIC_MODEL = auto()
+
+
+PASSTHROUGH_TYPES = frozenset((bytes, str, type(None)))
+
+JSON_TYPES = frozenset((bool, float, int, str, type(None)))
+
+FLAT_TYPES = (
+    bool,
+    date,
+    datetime,
+    Decimal,
+    float,
+    int,
+    str,
+    time,
+    timedelta,
+    type(None),
+    UUID,
+)
+
+
 def convert_response_return_value(
     result: ResponseReturnValue | HTTPException,
+    config: Optional[Mapping[str, Any]] = None,
 ) -> QuartResponseReturnValue | HTTPException:
-    value: ResponseValue
-    headers: Optional[HeadersValue] = None
-    status: Optional[StatusCode] = None
+    if config is None:
+        config = current_app.config
 
     if isinstance(result, HTTPException):
         return result
-    elif isinstance(result, tuple):
-        if len(result) == 3:
-            value, status, headers = result  # type: ignore
-        elif len(result) == 2:
-            value, status_or_headers = result
-            if isinstance(status_or_headers, int):
-                status = status_or_headers
-            else:
-                headers = status_or_headers  # type: ignore
-    else:
-        value = result
+
+    camelize = config["QUART_SCHEMA_CONVERT_CASING"]
+    preference = config["QUART_SCHEMA_CONVERSION_PREFERENCE"]
+    pydantic_kwargs = config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"]
+
+    if not isinstance(result, tuple):
+        return model_dump(
+            result, camelize=camelize, preference=preference, pydantic_kwargs=pydantic_kwargs
+        )
 
     value = model_dump(
-        value,
-        camelize=current_app.config["QUART_SCHEMA_CONVERT_CASING"],
-        preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-        pydantic_kwargs=current_app.config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
+        result[0], camelize=camelize, preference=preference, pydantic_kwargs=pydantic_kwargs
     )
-    headers = model_dump(
-        headers,  # type: ignore
-        kebabize=True,
-        preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-        pydantic_kwargs=current_app.config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
-    )
-
-    new_result: ResponseReturnValue
-    if isinstance(result, tuple):
-        if len(result) == 3:
-            new_result = value, status, headers
-        elif len(result) == 2:
-            if status is not None:
-                new_result = value, status
-            else:
-                new_result = value, headers
+    if len(result) == 3:
+        _, status, headers = result
+        return value, status, _dump_headers(headers, preference, pydantic_kwargs)
+    elif isinstance(result[1], int):
+        return value, result[1]
     else:
-        new_result = value
-
-    return new_result
+        return value, _dump_headers(result[1], preference, pydantic_kwargs)
 
 
 def model_dump(
@@ -137,31 +181,42 @@ def model_dump(
     preference: Optional[str] = None,
     pydantic_kwargs: Optional[PydanticDumpOptions] = None,
 ) -> dict | list:
-    if is_pydantic_dataclass(type(raw)):
-        value = RootModel[type(raw)](raw).model_dump(**(pydantic_kwargs or {}))  # type: ignore
-    elif isinstance(raw, BaseModel):
-        value = raw.model_dump(**(pydantic_kwargs or {}))
-    elif isinstance(raw, Struct) or is_attrs(raw):  # type: ignore
-        value = to_builtins(raw)
-    elif (
-        (isinstance(raw, (list, dict)) or is_dataclass(raw))
-        and PYDANTIC_INSTALLED
-        and preference != "msgspec"
-    ):
-        value = TypeAdapter(type(raw)).dump_python(raw, **(pydantic_kwargs or {}))
-    elif (
-        (isinstance(raw, (list, dict)) or is_dataclass(raw))
-        and MSGSPEC_INSTALLED
-        and preference != "pydantic"
-    ):
-        value = to_builtins(raw)
-    else:
+    if type(raw) in PASSTHROUGH_TYPES:
         return raw  # type: ignore
+    elif type(raw) in (dict, list) and not (camelize or kebabize or pydantic_kwargs):
+        values: Any = raw.values() if type(raw) is dict else raw
+        if all(type(item) in JSON_TYPES for item in values):
+            return raw  # type: ignore
+
+    strategy = _dump_strategy(type(raw), preference)  # type: ignore[arg-type]
+    if strategy is _DumpStrategy.PASSTHROUGH:
+        return raw  # type: ignore
+    elif strategy is _DumpStrategy.PYDANTIC_DATACLASS:
+        value = _root_model(type(raw))(raw).model_dump(**(pydantic_kwargs or {}))  # type: ignore
+    elif strategy is _DumpStrategy.PYDANTIC_MODEL:
+        value = raw.model_dump(**(pydantic_kwargs or {}))  # type: ignore
+    elif strategy is _DumpStrategy.PYDANTIC_ADAPTER:
+        flat_fields = None
+        if not pydantic_kwargs:
+            flat_fields = _flat_dataclass_fields(type(raw))  # type: ignore[arg-type]
+        if flat_fields is not None:
+            if camelize:
+                return {_camelize(name): getattr(raw, name) for name in flat_fields}
+            elif kebabize:
+                return {_kebabize(name): getattr(raw, name) for name in flat_fields}
+            else:
+                return {name: getattr(raw, name) for name in flat_fields}
+        else:
+            value = _type_adapter(type(raw)).dump_python(  # type: ignore[arg-type]
+                raw, **(pydantic_kwargs or {})
+            )
+    else:
+        value = to_builtins(raw)
 
     if camelize:
-        return humps.camelize(value)
+        return _convert_keys(value, _camelize)
     elif kebabize:
-        return humps.kebabize(value)
+        return _convert_keys(value, _kebabize)
     else:
         return value
 
@@ -175,34 +230,202 @@ def model_load(
     preference: Optional[str] = None,
 ) -> T:
     if decamelize:
-        data = humps.decamelize(data)
+        data = _convert_keys(data, _decamelize)
 
     try:
-        if _use_pydantic(model_class, preference):
-            return TypeAdapter(model_class).validate_python(data)
-        elif _use_msgspec(model_class, preference):
-            return convert(data, model_class, strict=False)
-        elif not PYDANTIC_INSTALLED and not MSGSPEC_INSTALLED:
-            raise RuntimeError(f"Cannot load {model_class} - try installing msgspec or pydantic")
-        else:
-            raise TypeError(f"Cannot load {model_class}")
+        return _model_loader(model_class, preference)(data)  # type: ignore[arg-type]
     except (TypeError, MsgSpecValidationError, PydanticValidationError, ValueError) as error:
         raise exception_class(error)
 
 
+def model_load_json(
+    data: Union[bytes, str],
+    model_class: Type[T],
+    exception_class: Type[Exception],
+    *,
+    preference: Optional[str] = None,
+) -> T:
+    try:
+        return _json_model_loader(model_class, preference)(data)  # type: ignore[arg-type]
+    except (TypeError, MsgSpecDecodeError, PydanticValidationError, ValueError) as error:
+        raise exception_class(error)
+
+
 def model_schema(
     model_class: Type[Model],
     *,
     preference: Optional[str] = None,
     schema_mode: JsonSchemaMode = "validation",
+) -> dict:
+    return deepcopy(_model_schema(model_class, preference, schema_mode))  # type: ignore[arg-type]
+
+
+def convert_headers(
+    raw: Union[Headers, dict], model_class: Type[T], exception_class: Type[Exception]
+) -> T:
+    fields_ = _field_names(model_class)  # type: ignore[arg-type]
+
+    result: Dict[str, Any] = {}
+    if isinstance(raw, Headers):
+        values: Dict[str, List[str]] = {}
+        for raw_key, value in raw.items():
+            key = _header_key(raw_key)
+            if key in fields_:
+                values.setdefault(key, []).append(value)
+        result = {key: ",".join(value) for key, value in values.items()}
+    else:
+        for raw_key, value in raw.items():
+            key = _header_key(raw_key)
+            if key in fields_:
+                result[key] = value
+
+    try:
+        return model_class(**result)
+    except (TypeError, MsgSpecValidationError, ValueError) as error:
+        raise exception_class(error)
+
+
+def _dump_headers(
+    headers: Any, preference: Optional[str], pydantic_kwargs: Optional[PydanticDumpOptions]
+) -> Any:
+    if headers is None:
+        return None
+    return model_dump(
+        headers, kebabize=True, preference=preference, pydantic_kwargs=pydantic_kwargs
+    )
+
+
+_camelize = lru_cache(maxsize=4096)(humps.camelize)
+_decamelize = lru_cache(maxsize=4096)(humps.decamelize)
+_kebabize = lru_cache(maxsize=4096)(humps.kebabize)
+
+
+@lru_cache(maxsize=4096)
+def _header_key(raw_key: str) -> str:
+    # Equivalent to humps.dekebabize(raw_key).lower()
+    return raw_key.replace("-", "_").lower()
+
+
+def _convert_keys(value: Any, convert: Callable[[Any], Any]) -> Any:
+    # Equivalent to humps' own traversal, but with the per key
+    # conversion cached as the keys repeat across requests.
+    if type(value) in JSON_TYPES:
+        return value
+    elif isinstance(value, list):
+        return [
+            item if type(item) in JSON_TYPES else _convert_keys(item, convert) for item in value
+        ]
+    elif isinstance(value, Mapping):
+        return {
+            convert(key): item if type(item) in JSON_TYPES else _convert_keys(item, convert)
+            for key, item in value.items()
+        }
+    else:
+        return value
+
+
+@lru_cache(maxsize=1024)
+def _dump_strategy(type_: Type, preference: Optional[str]) -> _DumpStrategy:
+    if is_pydantic_dataclass(type_):
+        return _DumpStrategy.PYDANTIC_DATACLASS
+    elif issubclass(type_, BaseModel):
+        return _DumpStrategy.PYDANTIC_MODEL
+    elif issubclass(type_, Struct) or is_attrs(type_):
+        return _DumpStrategy.MSGSPEC
+    elif (
+        (issubclass(type_, (list, dict)) or is_dataclass(type_))
+        and PYDANTIC_INSTALLED
+        and preference != "msgspec"
+    ):
+        return _DumpStrategy.PYDANTIC_ADAPTER
+    elif (
+        (issubclass(type_, (list, dict)) or is_dataclass(type_))
+        and MSGSPEC_INSTALLED
+        and preference != "pydantic"
+    ):
+        return _DumpStrategy.MSGSPEC
+    else:
+        return _DumpStrategy.PASSTHROUGH
+
+
+@lru_cache(maxsize=1024)
+def _flat_dataclass_fields(type_: Type) -> Optional[Tuple[str, ...]]:
+    # A (non pydantic) dataclass with only scalar fields dumps to its
+    # field values, which is quicker to build directly.
+    if not is_dataclass(type_) or is_pydantic_dataclass(type_):
+        return None
+
+    try:
+        hints = get_type_hints(type_, include_extras=True)
+    except Exception:
+        return None
+
+    names = tuple(field.name for field in fields(type_))
+    for name in names:
+        hint = hints.get(name)
+        if get_origin(hint) is Annotated:
+            # The metadata may change how pydantic dumps the field,
+            # e.g. Field(exclude=True) or a PlainSerializer.
+            return None
+        args = get_args(hint) if get_origin(hint) is Union else (hint,)
+        if not all(arg in FLAT_TYPES for arg in args):
+            return None
+    return names
+
+
+@lru_cache(maxsize=1024)
+def _field_names(model_class: Type[T]) -> FrozenSet[str]:
+    if is_pydantic_dataclass(model_class):
+        return frozenset(model_class.__pydantic_fields__.keys())
+    elif is_dataclass(model_class):
+        return frozenset(field.name for field in fields(model_class))
+    elif isclass(model_class) and issubclass(model_class, BaseModel):
+        return frozenset(model_class.model_fields.keys())
+    elif isclass(model_class) and issubclass(model_class, Struct):
+        return frozenset(model_class.__struct_fields__)
+    elif is_attrs(model_class):
+        return frozenset(field.name for field in attrs_fields(model_class))
+    else:
+        raise TypeError(f"Cannot convert to {model_class}")
+
+
+@lru_cache(maxsize=1024)
+def _model_loader(model_class: Type[T], preference: Optional[str]) -> Callable[[Any], T]:
+    if _use_pydantic(model_class, preference):
+        return _type_adapter(model_class).validate_python  # type: ignore[arg-type]
+    elif _use_msgspec(model_class, preference):
+        return partial(convert, type=model_class, strict=False)
+    elif not PYDANTIC_INSTALLED and not MSGSPEC_INSTALLED:
+        raise RuntimeError(f"Cannot load {model_class} - try installing msgspec or pydantic")
+    else:
+        raise TypeError(f"Cannot load {model_class}")
+
+
+@lru_cache(maxsize=1024)
+def _json_model_loader(
+    model_class: Type[T], preference: Optional[str]
+) -> Callable[[Union[bytes, str]], T]:
+    if _use_pydantic(model_class, preference):
+        return _type_adapter(model_class).validate_json  # type: ignore[arg-type]
+    elif _use_msgspec(model_class, preference):
+        return partial(json_decode, type=model_class, strict=False)
+    elif not PYDANTIC_INSTALLED and not MSGSPEC_INSTALLED:
+        raise RuntimeError(f"Cannot load {model_class} - try installing msgspec or pydantic")
+    else:
+        raise TypeError(f"Cannot load {model_class}")
+
+
+@lru_cache(maxsize=1024)
+def _model_schema(
+    model_class: Type[Model], preference: Optional[str], schema_mode: JsonSchemaMode
 ) -> dict:
     if _use_pydantic(model_class, preference):
-        return TypeAdapter(model_class).json_schema(
+        return _type_adapter(model_class).json_schema(  # type: ignore[arg-type]
             ref_template=PYDANTIC_REF_TEMPLATE, mode=schema_mode
         )
     elif _use_msgspec(model_class, preference):
         _, schema = schema_components([model_class], ref_template=MSGSPEC_REF_TEMPLATE)
-        return list(schema.values())[0]
+        return next(iter(schema.values()))
     elif not PYDANTIC_INSTALLED and not MSGSPEC_INSTALLED:
         raise TypeError(
             f"Cannot create schema for {model_class} - try installing msgspec or pydantic"
@@ -211,35 +434,14 @@ def model_schema(
         raise TypeError(f"Cannot create schema for {model_class}")
 
 
-def convert_headers(
-    raw: Union[Headers, dict], model_class: Type[T], exception_class: Type[Exception]
-) -> T:
-    if is_pydantic_dataclass(model_class):
-        fields_ = set(model_class.__pydantic_fields__.keys())
-    elif is_dataclass(model_class):
-        fields_ = {field.name for field in fields(model_class)}
-    elif isclass(model_class) and issubclass(model_class, BaseModel):
-        fields_ = set(model_class.model_fields.keys())
-    elif isclass(model_class) and issubclass(model_class, Struct):
-        fields_ = set(model_class.__struct_fields__)
-    elif is_attrs(model_class):
-        fields_ = {field.name for field in attrs_fields(model_class)}
-    else:
-        raise TypeError(f"Cannot convert to {model_class}")
+@lru_cache(maxsize=1024)
+def _root_model(type_: Type) -> Type[RootModel]:
+    return RootModel[type_]  # type: ignore
 
-    result = {}
-    for raw_key in raw.keys():
-        key = humps.dekebabize(raw_key).lower()
-        if key in fields_:
-            if isinstance(raw, Headers):
-                result[key] = ",".join(raw.get_all(raw_key))
-            else:
-                result[key] = raw[raw_key]
 
-    try:
-        return model_class(**result)  # type: ignore[return-value]
-    except (TypeError, MsgSpecValidationError, ValueError) as error:
-        raise exception_class(error)
+@lru_cache(maxsize=1024)
+def _type_adapter(type_: Type) -> TypeAdapter:
+    return TypeAdapter(type_)
 
 
 def _is_list_or_dict(type_: Type) -> bool:
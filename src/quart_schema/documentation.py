@@ -130,13 +130,16 @@ def document(
 
     def decorator(func: T) -> T:
         if querystring is not None:
-            func = document_querystring(querystring)(func)
+            setattr(func, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, querystring)
         if request is not None:
-            func = document_request(request, source=request_source)(func)
+            setattr(func, QUART_SCHEMA_REQUEST_ATTRIBUTE, (request, request_source))
         if headers is not None:
-            func = document_headers(headers)(func)
-        for status, models in responses.items():
-            func = document_response(models[0], status, models[1])(func)
+            setattr(func, QUART_SCHEMA_HEADERS_ATTRIBUTE, headers)
+        if responses:
+            schemas = getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {})
+            for status, models in responses.items():
+                schemas[status] = (models[0], models[1])
+            setattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, schemas)
         return func
 
     return decorator
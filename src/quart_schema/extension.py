@@ -6,12 +6,15 @@ from types import new_class
 from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Type, TypeVar, Union
 
 import click
-from quart import current_app, Quart, render_template_string, ResponseReturnValue
+from quart import current_app, Quart, render_template_string, request, Response, ResponseReturnValue
 from quart.cli import pass_script_info, ScriptInfo
+from quart.config import Config
 from quart.json.provider import DefaultJSONProvider
 from quart.typing import ResponseReturnValue as QuartResponseReturnValue
+from werkzeug.http import generate_etag
+from werkzeug.wrappers import Response as WerkzeugResponse
 
-from .conversion import convert_response_return_value
+from .conversion import convert_response_return_value, PASSTHROUGH_TYPES
 from .mixins import TestClientMixin, WebsocketMixin
 from .openapi import (
     APIKeySecurityScheme,
@@ -42,6 +45,18 @@ try:
 except ImportError:
     to_builtins = None
 
+try:
+    from orjson import (
+        dumps as orjson_dumps,
+        OPT_INDENT_2,
+        OPT_NON_STR_KEYS,
+        OPT_PASSTHROUGH_DATACLASS,
+        OPT_PASSTHROUGH_DATETIME,
+        OPT_SORT_KEYS,
+    )
+except ImportError:
+    orjson_dumps = None
+
 T = TypeVar("T", bound=Callable)
 
 SecurityScheme = Union[
@@ -62,6 +77,9 @@ SecuritySchemeInput = Union[
 
 PATH_RE = re.compile("<(?:[^:]*:)?([^>]+)>")
 
+COMPACT_SEPARATORS = (",", ":")
+ORJSON_COMPATIBLE_KWARGS = {"ensure_ascii", "indent", "separators", "sort_keys"}
+
 REDOC_TEMPLATE = """
 <head>
   <title>{{ title }}</title>
@@ -126,15 +144,39 @@ def create_json_provider(app: Quart) -> DefaultJSONProvider:
     class JSONProvider(DefaultJSONProvider):
         @staticmethod
         def default(object_: Any) -> Any:
+            if to_jsonable_python is not None and preference != "msgspec":
+                return to_jsonable_python(object_)
+            elif to_builtins is not None and preference != "pydantic":
+                return to_builtins(object_)
+            else:
+                return DefaultJSONProvider.default(object_)
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            if (
+                orjson_dumps is None
+                or not kwargs.keys() <= ORJSON_COMPATIBLE_KWARGS
+                or kwargs.get("ensure_ascii", self.ensure_ascii)
+            ):
+                return super().dumps(obj, **kwargs)
+
+            indent = kwargs.get("indent")
+            separators = kwargs.get("separators")
+            # Datetimes and dataclasses are passed to the default hook,
+            # so that they encode as they do via the stdlib.
+            option = OPT_NON_STR_KEYS | OPT_PASSTHROUGH_DATACLASS | OPT_PASSTHROUGH_DATETIME
+            if indent == 2 and separators is None:
+                option |= OPT_INDENT_2
+            elif indent is not None or tuple(separators or ()) != COMPACT_SEPARATORS:
+                return super().dumps(obj, **kwargs)
+            if kwargs.get("sort_keys", self.sort_keys):
+                option |= OPT_SORT_KEYS
+
             try:
-                return super().default(object_)
+                return orjson_dumps(obj, default=self.default, option=option).decode()
             except TypeError:
-                if to_jsonable_python is not None and preference != "msgspec":
-                    return to_jsonable_python(object_)
-                elif to_builtins is not None and preference != "pydantic":
-                    return to_builtins(object_)
-                else:
-                    raise
+                # orjson is stricter than the stdlib, for example it
+                # rejects integers larger than 64 bits.
+                return super().dumps(obj, **kwargs)
 
     return JSONProvider(app)
 
@@ -279,7 +321,7 @@ class QuartSchema:
         app.websocket_class = new_class(  # type: ignore
             "Websocket", (WebsocketMixin, app.websocket_class)
         )
-        app.make_response = wrap_make_response(app.make_response)  # type: ignore
+        app.make_response = wrap_make_response(app.make_response, app.config)  # type: ignore
 
         app.config.setdefault(
             "QUART_SCHEMA_SWAGGER_JS_URL",
@@ -302,6 +344,11 @@ class QuartSchema:
         app.config.setdefault("QUART_SCHEMA_CONVERSION_PREFERENCE", self.conversion_preference)
         app.json = create_json_provider(app)
         self.openapi_provider = self.openapi_provider_class(app, self)
+        self._openapi_json: Optional[bytes] = None
+        self._openapi_etag: Optional[str] = None
+        self._redoc_ui_html: Optional[str] = None
+        self._scalar_ui_html: Optional[str] = None
+        self._swagger_ui_html: Optional[str] = None
 
         if self.openapi_path is not None:
             hide(app.send_static_file.__func__)  # type: ignore
@@ -317,36 +364,52 @@ class QuartSchema:
 
     @hide
     async def openapi(self) -> ResponseReturnValue:
-        schema = self.openapi_provider.schema()
-        return current_app.json.response(schema)  # type: ignore
+        # The routes cannot change once the app has started serving
+        # requests, so the schema only needs to be built once.
+        if self._openapi_json is None:
+            response = current_app.json.response(self.openapi_provider.schema())
+            self._openapi_json = await response.get_data(as_text=False)  # type: ignore
+            self._openapi_etag = generate_etag(self._openapi_json)
+
+        response = current_app.response_class(
+            self._openapi_json, mimetype=current_app.json.mimetype  # type: ignore
+        )
+        response.set_etag(self._openapi_etag)
+        return await response.make_conditional(request)
 
     @hide
     async def swagger_ui(self) -> str:
-        return await render_template_string(
-            SWAGGER_TEMPLATE,
-            title=self.info.title,
-            openapi_path=self.openapi_path,
-            swagger_js_url=current_app.config["QUART_SCHEMA_SWAGGER_JS_URL"],
-            swagger_css_url=current_app.config["QUART_SCHEMA_SWAGGER_CSS_URL"],
-        )
+        if self._swagger_ui_html is None:
+            self._swagger_ui_html = await render_template_string(
+                SWAGGER_TEMPLATE,
+                title=self.info.title,
+                openapi_path=self.openapi_path,
+                swagger_js_url=current_app.config["QUART_SCHEMA_SWAGGER_JS_URL"],
+                swagger_css_url=current_app.config["QUART_SCHEMA_SWAGGER_CSS_URL"],
+            )
+        return self._swagger_ui_html
 
     @hide
     async def redoc_ui(self) -> str:
-        return await render_template_string(
-            REDOC_TEMPLATE,
-            title=self.info.title,
-            openapi_path=self.openapi_path,
-            redoc_js_url=current_app.config["QUART_SCHEMA_REDOC_JS_URL"],
-        )
+        if self._redoc_ui_html is None:
+            self._redoc_ui_html = await render_template_string(
+                REDOC_TEMPLATE,
+                title=self.info.title,
+                openapi_path=self.openapi_path,
+                redoc_js_url=current_app.config["QUART_SCHEMA_REDOC_JS_URL"],
+            )
+        return self._redoc_ui_html
 
     @hide
     async def scalar_ui(self) -> str:
-        return await render_template_string(
-            SCALAR_TEMPLATE,
-            title=self.info.title,
-            openapi_path=self.openapi_path,
-            scalar_js_url=current_app.config["QUART_SCHEMA_SCALAR_JS_URL"],
-        )
+        if self._scalar_ui_html is None:
+            self._scalar_ui_html = await render_template_string(
+                SCALAR_TEMPLATE,
+                title=self.info.title,
+                openapi_path=self.openapi_path,
+                scalar_js_url=current_app.config["QUART_SCHEMA_SCALAR_JS_URL"],
+            )
+        return self._scalar_ui_html
 
 
 @click.command("schema")
@@ -368,10 +431,12 @@ def _schema_command(info: ScriptInfo, output: Optional[str]) -> None:
         click.echo(formatted_spec)
 
 
-def wrap_make_response(func: Callable) -> Callable:
+def wrap_make_response(func: Callable, config: Optional[Config] = None) -> Callable:
     @wraps(func)
     async def decorator(result: ResponseReturnValue) -> QuartResponseReturnValue:
-        return await func(convert_response_return_value(result))
+        if type(result) in PASSTHROUGH_TYPES or isinstance(result, (Response, WerkzeugResponse)):
+            return await func(result)
+        return await func(convert_response_return_value(result, config))
 
     return decorator
 
@@ -407,7 +472,7 @@ def tag(tags: Iterable[str]) -> Callable[[T], T]:
     """
 
     def decorator(func: T) -> T:
-        setattr(func, QUART_SCHEMA_TAG_ATTRIBUTE, set(tags))
+        setattr(func, QUART_SCHEMA_TAG_ATTRIBUTE, tuple(dict.fromkeys(tags)))
 
         return func
 
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, AnyStr, Dict, Optional, Tuple, Type, Union
 
 from quart import current_app, Response
 from quart.datastructures import FileStorage
+from quart.json.provider import DefaultJSONProvider
 from quart.testing.utils import sentinel
 from werkzeug.datastructures import Authorization, Headers
 
-from .conversion import model_dump, model_load
+from .conversion import model_dump, model_load, model_load_json
 from .typing import Model, TestClientProtocol, WebsocketProtocol
 
 
@@ -19,28 +21,42 @@ class SchemaValidationError(Exception):
 
 class WebsocketMixin:
     async def receive_as(self: WebsocketProtocol, model_class: Type[Model]) -> Model:
-        data = await self.receive_json()
+        config = current_app.config
+        decamelize = config["QUART_SCHEMA_CONVERT_CASING"]
+        preference = config["QUART_SCHEMA_CONVERSION_PREFERENCE"]
+        data = await self.receive()
+        if not decamelize and type(current_app.json).loads is DefaultJSONProvider.loads:
+            try:
+                return model_load_json(
+                    data, model_class, SchemaValidationError, preference=preference
+                )
+            except SchemaValidationError:
+                # Load via app.json instead, so that invalid JSON still
+                # raises the decoding error.
+                pass
+
         return model_load(
-            data,
+            current_app.json.loads(data),
             model_class,
             SchemaValidationError,
-            decamelize=current_app.config["QUART_SCHEMA_CONVERT_CASING"],
-            preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+            decamelize=decamelize,
+            preference=preference,
         )
 
     async def send_as(self: WebsocketProtocol, value: Any, model_class: Type[Model]) -> None:
-        if type(value) != model_class:  # noqa: E721
+        config = current_app.config
+        if type(value) is not model_class:
             value = model_load(
                 value,
                 model_class,
                 SchemaValidationError,
-                preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+                preference=config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
             )
         data = model_dump(
             value,
-            camelize=current_app.config["QUART_SCHEMA_CONVERT_CASING"],
-            preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-            pydantic_kwargs=current_app.config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
+            camelize=config["QUART_SCHEMA_CONVERT_CASING"],
+            preference=config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+            pydantic_kwargs=config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
         )
         await self.send_json(data)  # type: ignore
 
@@ -63,28 +79,20 @@ class TestClientMixin:
         auth: Optional[Union[Authorization, Tuple[str, str]]] = None,
         subdomain: Optional[str] = None,
     ) -> Response:
-        if json is not sentinel:
-            json = model_dump(
-                json,
-                camelize=self.app.config["QUART_SCHEMA_CONVERT_CASING"],
-                preference=self.app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-                pydantic_kwargs=self.app.config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
-            )
-
-        if form is not None:
-            form = model_dump(  # type: ignore
-                form,
-                camelize=self.app.config["QUART_SCHEMA_CONVERT_CASING"],
-                preference=self.app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-                pydantic_kwargs=self.app.config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
-            )
-        if query_string is not None:
-            query_string = model_dump(  # type: ignore
-                query_string,
-                camelize=self.app.config["QUART_SCHEMA_CONVERT_CASING"],
-                preference=self.app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-                pydantic_kwargs=self.app.config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
+        if json is not sentinel or form is not None or query_string is not None:
+            config = self.app.config
+            dump = partial(
+                model_dump,
+                camelize=config["QUART_SCHEMA_CONVERT_CASING"],
+                preference=config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+                pydantic_kwargs=config["QUART_SCHEMA_PYDANTIC_DUMP_OPTIONS"],
             )
+            if json is not sentinel:
+                json = dump(json)
+            if form is not None:
+                form = dump(form)  # type: ignore
+            if query_string is not None:
+                query_string = dump(query_string)  # type: ignore
 
         return await super()._make_request(  # type: ignore
             path,
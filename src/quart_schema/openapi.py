@@ -4,6 +4,7 @@ import inspect
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -18,12 +19,11 @@ from typing import (
 )
 from weakref import proxy
 
-import humps
 from quart import Quart
 from werkzeug.routing.converters import AnyConverter, BaseConverter, NumberConverter
 from werkzeug.routing.rules import Rule
 
-from .conversion import model_schema
+from .conversion import _camelize, _convert_keys, _kebabize, model_schema, MSGSPEC_REF_TEMPLATE
 from .typing import Model
 from .validation import (
     DataSource,
@@ -43,6 +43,9 @@ QUART_SCHEMA_SECURITY_ATTRIBUTE = "_quart_schema_security_tag"
 QUART_SCHEMA_DEPRECATED_ATTRIBUTE = "_quart_schema_deprecated"
 
 PATH_RE = re.compile("<(?:[^:]*:)?([^>]+)>")
+COMPONENT_NAME_RE = re.compile(r"^[a-zA-Z0-9\.\-_]+$")
+
+_getdoc = lru_cache(maxsize=1024)(inspect.getdoc)
 
 
 class OpenAPIProvider:
@@ -70,6 +73,8 @@ class OpenAPIProvider:
                 schema["paths"][path].update(path_object)  # type: ignore
             schema["components"]["schemas"].update(path_components)  # type: ignore
 
+        _reference_model_schemas(schema["paths"], schema["components"]["schemas"])  # type: ignore
+
         if self._extension.security_schemes is not None:
             schema["components"]["securitySchemes"] = {  # type: ignore
                 key: value.schema(camelize=True)
@@ -97,11 +102,13 @@ class OpenAPIProvider:
             An iterable of the rules to include ordered as desired.
 
         """
+        view_functions = self._app.view_functions
         for rule in self._app.url_map.iter_rules():
-            hidden = getattr(
-                self._app.view_functions[rule.endpoint], QUART_SCHEMA_HIDDEN_ATTRIBUTE, False
-            )
-            if not hidden and not rule.websocket:
+            if rule.websocket:
+                continue
+
+            hidden = getattr(view_functions[rule.endpoint], QUART_SCHEMA_HIDDEN_ATTRIBUTE, False)
+            if not hidden:
                 yield rule
 
     def build_paths(self, rule: Rule) -> Tuple[dict, dict]:
@@ -124,18 +131,20 @@ class OpenAPIProvider:
             "responses": {},
         }
         if func.__doc__ is not None:
-            summary, *description = inspect.getdoc(func).splitlines()
+            summary, *description = _getdoc(func).splitlines()
             operation_object["description"] = "\n".join(description)
             operation_object["summary"] = summary
 
-        if getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE, None) is not None:
-            operation_object["tags"] = list(getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE))
+        tags = getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE, None)
+        if tags is not None:
+            operation_object["tags"] = list(tags)
 
         if getattr(func, QUART_SCHEMA_DEPRECATED_ATTRIBUTE, None):
             operation_object["deprecated"] = True
 
-        if getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE, None) is not None:
-            operation_object["security"] = list(getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE))
+        security = getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE, None)
+        if security is not None:
+            operation_object["security"] = list(security)
 
         for name, converter in rule._converters.items():
             parameter_object = self.build_path_parameter(name, converter)
@@ -164,26 +173,21 @@ class OpenAPIProvider:
             components.update(request_components)
 
         response_models = getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {})
-        for status_code in response_models.keys():
-            response_model, headers_model = response_models[status_code]
+        for status_code, (response_model, headers_model) in response_models.items():
             response_object, response_components = self.build_response_object(
                 response_model, headers_model
             )
             operation_object["responses"][status_code] = response_object
             components.update(response_components)
 
-        path = re.sub(PATH_RE, r"{\1}", rule.rule)
-        paths = {path: {}}  # type: ignore
-
+        path_object: Dict[str, Any] = {}
         for method in self.generate_methods(rule):
-            per_method_operation_object = operation_object.copy()
-
             operation_id = self.operation_id(method, func)
-            if operation_id is not None:
-                per_method_operation_object["operationId"] = operation_id
-
-            paths[path][method.lower()] = per_method_operation_object
-        return paths, components
+            if operation_id is None:
+                path_object[method.lower()] = operation_object.copy()
+            else:
+                path_object[method.lower()] = {**operation_object, "operationId": operation_id}
+        return {_openapi_path(rule.rule): path_object}, components
 
     def build_path_parameter(self, name: str, converter: BaseConverter) -> Dict[str, Any]:
         """Build the openapi path parameter objects based on the converter.
@@ -265,7 +269,7 @@ class OpenAPIProvider:
         definitions, schema = _split_definitions(schema)
         parameters = []
         for name, type_ in schema["properties"].items():
-            param = {"name": humps.kebabize(name), "in": "header", "schema": type_}
+            param = {"name": _kebabize(name), "in": "header", "schema": type_}
 
             for attribute in ("description", "required", "deprecated"):
                 if attribute in type_:
@@ -327,11 +331,8 @@ class OpenAPIProvider:
             A tuple of the built response object and component definitions.
 
         """
-        schema = model_schema(
-            model,
-            preference=self._app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-            schema_mode="serialization",
-        )
+        preference = self._app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"]
+        schema = model_schema(model, preference=preference, schema_mode="serialization")
         definitions, schema = _split_convert_definitions(
             schema, self._app.config["QUART_SCHEMA_CONVERT_CASING"]
         )
@@ -344,17 +345,14 @@ class OpenAPIProvider:
             "description": "",
         }
         if model.__doc__ is not None:
-            response_object["description"] = inspect.getdoc(model)
+            response_object["description"] = _getdoc(model)  # type: ignore[arg-type]
 
         if headers_model is not None:
-            schema = model_schema(
-                headers_model,
-                preference=self._app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-            )
+            schema = model_schema(headers_model, preference=preference)
             header_definitions, schema = _split_definitions(schema)
             definitions.update(header_definitions)
             response_object["content"]["headers"] = {  # type: ignore
-                humps.kebabize(name): {
+                _kebabize(name): {
                     "schema": type_,
                 }
                 for name, type_ in schema["properties"].items()
@@ -397,17 +395,23 @@ class OpenAPIProvider:
 class _SchemaBase:
     def schema(self, *, camelize: bool = False) -> Dict:
         result: Dict[str, Any] = {}
-        for field_ in fields(self):  # type: ignore
-            value = getattr(self, field_.name, None)
+        for attribute, alias, camel_alias in _schema_fields(type(self)):  # type: ignore[arg-type]
+            value = getattr(self, attribute, None)
 
             if value is not None:
-                name = field_.metadata.get("alias", field_.name)
-                if camelize:
-                    name = humps.camelize(name)
-                result[name] = value
+                result[camel_alias if camelize else alias] = value
         return result
 
 
+@lru_cache(maxsize=1024)
+def _schema_fields(cls: type) -> Tuple[Tuple[str, str, str], ...]:
+    result = []
+    for field_ in fields(cls):
+        alias = field_.metadata.get("alias", field_.name)
+        result.append((field_.name, alias, _camelize(alias)))
+    return tuple(result)
+
+
 @dataclass
 class Contact(_SchemaBase):
     """This describes contact information for the API.
@@ -574,20 +578,61 @@ class OpenIdSecurityScheme(SecuritySchemeBase):
     type: Literal["openIdConnect"] = "openIdConnect"
 
 
+@lru_cache(maxsize=4096)
+def _openapi_path(rule: str) -> str:
+    return PATH_RE.sub(r"{\1}", rule)
+
+
 def _split_definitions(schema: dict) -> Tuple[dict, dict]:
-    new_schema = schema.copy()
-    definitions = new_schema.pop("$defs", {})
-    return definitions, new_schema
+    # Note the schema is modified, as model_schema returns a new copy.
+    definitions = schema.pop("$defs", {})
+    return definitions, schema
 
 
 def _split_convert_definitions(schema: dict, convert_casing: bool) -> Tuple[dict, dict]:
     definitions, new_schema = _split_definitions(schema)
     if convert_casing:
-        new_schema = humps.camelize(new_schema)
-        if "required" in new_schema:
-            new_schema["required"] = [humps.camelize(field) for field in new_schema["required"]]
-        definitions = {key: humps.camelize(definition) for key, definition in definitions.items()}
-        for key, definition in definitions.items():
-            if "required" in definition:
-                definition["required"] = [humps.camelize(field) for field in definition["required"]]
+        new_schema = _camelize_schema(new_schema)
+        definitions = {key: _camelize_schema(definition) for key, definition in definitions.items()}
     return definitions, new_schema
+
+
+def _camelize_schema(schema: dict) -> dict:
+    # Equivalent to humps.camelize followed by camelizing the top
+    # level required field names, in a single traversal.
+    result = {}
+    for key, value in schema.items():
+        if key == "required":
+            result[key] = [_camelize(field) for field in value]
+        else:
+            result[_camelize(key)] = _convert_keys(value, _camelize)
+    return result
+
+
+def _reference_model_schemas(paths: Dict[str, Any], components: Dict[str, Any]) -> None:
+    # Move the request and response body schemas into the components,
+    # so that models used by many routes are only included once.
+    for path_object in paths.values():
+        for operation_object in path_object.values():
+            if not isinstance(operation_object, dict):
+                # E.g. path level parameters or servers
+                continue
+
+            request_body = operation_object.get("requestBody", {})
+            _reference_content_schemas(request_body.get("content", {}), components)
+            for response_object in operation_object.get("responses", {}).values():
+                _reference_content_schemas(response_object.get("content", {}), components)
+
+
+def _reference_content_schemas(content: Dict[str, Any], components: Dict[str, Any]) -> None:
+    for media_type_object in content.values():
+        schema = media_type_object.get("schema")
+        if schema is None:
+            continue
+
+        name = schema.get("title")
+        if name is None or COMPONENT_NAME_RE.match(name) is None:
+            continue
+
+        if components.setdefault(name, schema) == schema:
+            media_type_object["schema"] = {"$ref": MSGSPEC_REF_TEMPLATE.format(name=name)}
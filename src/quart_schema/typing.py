@@ -65,6 +65,8 @@ ResponseReturnValue = Union[
 
 
 class WebsocketProtocol(Protocol):
+    async def receive(self) -> AnyStr: ...
+
     async def receive_json(self) -> dict: ...
 
     async def send_json(self, data: dict) -> None: ...
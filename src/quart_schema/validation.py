@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from enum import auto, Enum
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Tuple, Type
+from inspect import iscoroutinefunction
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
 
 from quart import current_app, request, Response
+from quart.json.provider import DefaultJSONProvider
+from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import BadRequest
 from werkzeug.wrappers import Response as WerkzeugResponse
 
-from .conversion import convert_headers, model_load
+from .conversion import convert_headers, model_load, model_load_json
 from .typing import Model, ResponseReturnValue
 
 QUART_SCHEMA_HEADERS_ATTRIBUTE = "_quart_schema_headers_schema"
@@ -66,24 +69,19 @@ def validate_querystring(model_class: Type[Model]) -> Callable:
     def decorator(func: Callable) -> Callable:
         setattr(func, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, model_class)
 
+        call = _ensure_async(func)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            request_args = {
-                key: (
-                    request.args.getlist(key)
-                    if len(request.args.getlist(key)) > 1
-                    else request.args[key]
-                )
-                for key in request.args
-            }
+            config = current_app.config
             model = model_load(
-                request_args,
+                _multidict_to_dict(request.args),
                 model_class,
                 QuerystringValidationError,
-                decamelize=current_app.config["QUART_SCHEMA_CONVERT_CASING"],
-                preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+                decamelize=config["QUART_SCHEMA_CONVERT_CASING"],
+                preference=config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
             )
-            return await current_app.ensure_async(func)(*args, query_args=model, **kwargs)
+            return await call(*args, query_args=model, **kwargs)
 
         return wrapper
 
@@ -107,10 +105,12 @@ def validate_headers(model_class: Type[Model]) -> Callable:
     def decorator(func: Callable) -> Callable:
         setattr(func, QUART_SCHEMA_HEADERS_ATTRIBUTE, model_class)
 
+        call = _ensure_async(func)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             model = convert_headers(request.headers, model_class, RequestHeadersValidationError)
-            return await current_app.ensure_async(func)(*args, headers=model, **kwargs)
+            return await call(*args, headers=model, **kwargs)
 
         return wrapper
 
@@ -140,34 +140,49 @@ def validate_request(
     def decorator(func: Callable) -> Callable:
         setattr(func, QUART_SCHEMA_REQUEST_ATTRIBUTE, (model_class, source))
 
+        load_data: Callable[[], Awaitable[Any]]
+        if source == DataSource.JSON:
+            load_data = _load_json_data
+        elif source == DataSource.FORM_MULTIPART:
+            load_data = _load_multipart_data
+        else:
+            load_data = _load_form_data
+
+        call = _ensure_async(func)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if source == DataSource.JSON:
-                data = await request.get_json()
-            else:
-                data = {}
-                form = await request.form
-                for key in form:
-                    if len(form.getlist(key)) > 1:
-                        data[key] = form.getlist(key)
-                    else:
-                        data[key] = form[key]
-                if source == DataSource.FORM_MULTIPART:
-                    files = await request.files
-                    for key in files:
-                        if len(files.getlist(key)) > 1:
-                            data[key] = files.getlist(key)
-                        else:
-                            data[key] = files[key]
-
-            model = model_load(
-                data,
-                model_class,
-                RequestSchemaValidationError,
-                decamelize=current_app.config["QUART_SCHEMA_CONVERT_CASING"],
-                preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-            )
-            return await current_app.ensure_async(func)(*args, data=model, **kwargs)
+            config = current_app.config
+            decamelize = config["QUART_SCHEMA_CONVERT_CASING"]
+            preference = config["QUART_SCHEMA_CONVERSION_PREFERENCE"]
+            model = None
+            if (
+                load_data is _load_json_data
+                and not decamelize
+                and request.is_json
+                and type(current_app.json).loads is DefaultJSONProvider.loads
+            ):
+                try:
+                    model = model_load_json(
+                        await request.get_data(),
+                        model_class,
+                        RequestSchemaValidationError,
+                        preference=preference,
+                    )
+                except RequestSchemaValidationError:
+                    # Load via get_json instead, so that invalid JSON
+                    # still results in a BadRequest.
+                    pass
+
+            if model is None:
+                model = model_load(
+                    await load_data(),
+                    model_class,
+                    RequestSchemaValidationError,
+                    decamelize=decamelize,
+                    preference=preference,
+                )
+            return await call(*args, data=model, **kwargs)
 
         return wrapper
 
@@ -204,9 +219,11 @@ def validate_response(
         schemas[status_code] = (model_class, headers_model_class)
         setattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, schemas)
 
+        call = _ensure_async(func)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            result = await current_app.ensure_async(func)(*args, **kwargs)
+            result = await call(*args, **kwargs)
 
             status_or_headers = None
             headers = None
@@ -228,22 +245,22 @@ def validate_response(
                     return result
 
             if status == status_code:
-                if type(value) == model_class:  # noqa: E721
+                if type(value) is model_class:
                     model_value = value
                 else:
                     model_value = model_load(
-                        value,  # type: ignore
+                        value,
                         model_class,
                         ResponseSchemaValidationError,
                         preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
                     )
 
                 if headers_model_class is not None:
-                    if type(headers) == headers_model_class:  # noqa: E721
+                    if type(headers) is headers_model_class:
                         headers_value = headers
                     else:
                         headers_value = convert_headers(
-                            headers,  # type: ignore
+                            headers,
                             headers_model_class,
                             ResponseHeadersValidationError,
                         )
@@ -286,3 +303,35 @@ def validate(
         return func
 
     return decorator
+
+
+def _ensure_async(func: Callable) -> Callable[..., Awaitable[Any]]:
+    if iscoroutinefunction(func):
+        return func
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await current_app.ensure_async(func)(*args, **kwargs)
+
+    return wrapper
+
+
+async def _load_json_data() -> Any:
+    return await request.get_json()
+
+
+async def _load_form_data() -> Dict[str, Any]:
+    return _multidict_to_dict(await request.form)
+
+
+async def _load_multipart_data() -> Dict[str, Any]:
+    data = _multidict_to_dict(await request.form)
+    data.update(_multidict_to_dict(await request.files))
+    return data
+
+
+def _multidict_to_dict(multidict: MultiDict) -> Dict[str, Any]:
+    data = {}
+    for key in multidict:
+        values = multidict.getlist(key)
+        data[key] = values if len(values) > 1 else values[0]
+    return data
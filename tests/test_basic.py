@@ -1,11 +1,13 @@
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Type, Union
+from typing import Any, Type, Union
 from uuid import UUID
 
 import pytest
 from pydantic import BaseModel
-from quart import Quart, ResponseReturnValue
+from quart import Quart, render_template_string, ResponseReturnValue
 
+import quart_schema.extension
 from quart_schema import QuartSchema
 from .helpers import ADetails, DCDetails, MDetails, PyDCDetails, PyDetails
 
@@ -57,3 +59,47 @@ async def test_make_pydantic_encoder_response() -> None:
     test_client = app.test_client()
     response = await test_client.get("/")
     assert (await response.get_json()) == {"a": "23ef2e02-1c20-49de-b05e-e9fe2431c474", "b": "/"}
+
+
+def test_json_provider_default() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    assert (
+        app.json.dumps({"at": datetime(2024, 1, 2), "details": PyDetails(name="bob", age=2)})
+        == '{"at": "2024-01-02T00:00:00", "details": {"age": 2, "name": "bob"}}'
+    )
+
+
+def test_json_provider_orjson() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    assert app.json.dumps({"b": "é"}, separators=(",", ":")) == '{"b":"\\u00e9"}'
+    app.json.ensure_ascii = False  # type: ignore
+    assert app.json.dumps({"b": "é", "a": 1}, separators=(",", ":")) == '{"a":1,"b":"é"}'
+    assert app.json.dumps({"b": "é"}, ensure_ascii=True) == '{"b": "\\u00e9"}'
+    at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert app.json.dumps({"at": at}, separators=(",", ":")) == '{"at":"2024-01-02T00:00:00Z"}'
+
+
+@pytest.mark.parametrize("path", ["/docs", "/redocs", "/scalar"])
+async def test_docs_ui(path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    calls = 0
+
+    async def _counting_render(source: str, **context: Any) -> str:
+        nonlocal calls
+        calls += 1
+        return await render_template_string(source, **context)
+
+    monkeypatch.setattr(quart_schema.extension, "render_template_string", _counting_render)
+
+    test_client = app.test_client()
+    first = await (await test_client.get(path)).get_data(as_text=True)
+    second = await (await test_client.get(path)).get_data(as_text=True)
+    assert first == second
+    assert "/openapi.json" in first
+    assert calls == 1
@@ -1,13 +1,21 @@
 from dataclasses import dataclass
-from typing import List, Type, Union
+from datetime import datetime, timezone
+from typing import Annotated, Dict, List, Type, Union
 
 import pytest
 from attrs import define
 from msgspec import Struct
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PlainSerializer
 from pydantic.dataclasses import dataclass as pydantic_dataclass
+from werkzeug.datastructures import Headers
 
-from quart_schema.conversion import convert_headers, model_dump, model_load, model_schema
+from quart_schema.conversion import (
+    convert_headers,
+    model_dump,
+    model_load,
+    model_load_json,
+    model_schema,
+)
 from .helpers import ADetails, DCDetails, MDetails, PyDCDetails, PyDetails
 
 
@@ -25,6 +33,22 @@ def test_model_dump(
     }
 
 
+@dataclass
+class DCGroup:
+    name: str
+    members: List[DCDetails]
+
+
+def test_model_dump_dataclass() -> None:
+    assert model_dump(DCGroup(name="a", members=[DCDetails(name="bob")])) == {  # type: ignore
+        "name": "a",
+        "members": [{"name": "bob", "age": None}],
+    }
+    assert model_dump(
+        DCDetails(name="bob"), pydantic_kwargs={"exclude_none": True}  # type: ignore
+    ) == {"name": "bob"}
+
+
 @pytest.mark.parametrize(
     "type_, preference",
     [
@@ -54,6 +78,29 @@ def test_model_load(
     )
 
 
+@pytest.mark.parametrize(
+    "type_, preference",
+    [
+        (ADetails, "msgspec"),
+        (DCDetails, "msgspec"),
+        (DCDetails, "pydantic"),
+        (MDetails, "msgspec"),
+        (PyDetails, "pydantic"),
+        (PyDCDetails, "pydantic"),
+    ],
+)
+def test_model_load_json(
+    type_: Type[Union[ADetails, DCDetails, MDetails, PyDetails, PyDCDetails]],
+    preference: str,
+) -> None:
+    assert model_load_json(
+        b'{"name": "bob", "age": 2}',
+        type_,
+        exception_class=ValidationError,
+        preference=preference,
+    ) == type_(name="bob", age=2)
+
+
 @pytest.mark.parametrize(
     "type_, preference",
     [
@@ -85,6 +132,16 @@ def test_model_load_error(
         model_load({"name": "bob", "age": "two"}, type_, exception_class=ValidationError)
 
 
+@pytest.mark.parametrize("type_", [ADetails, DCDetails, MDetails, PyDetails, PyDCDetails])
+@pytest.mark.parametrize("data", [b'{"name": "bob", "age": "two"}', b'{"name": "bob"'])
+def test_model_load_json_error(
+    type_: Type[Union[ADetails, DCDetails, MDetails, PyDetails, PyDCDetails]],
+    data: bytes,
+) -> None:
+    with pytest.raises(ValidationError):
+        model_load_json(data, type_, exception_class=ValidationError)
+
+
 @pytest.mark.parametrize("type_", [ADetails, DCDetails, MDetails])
 def test_model_schema_msgspec(type_: Type[Union[ADetails, DCDetails, MDetails]]) -> None:
     assert model_schema(type_, preference="msgspec") == {
@@ -115,6 +172,12 @@ def test_model_schema_pydantic(type_: Type[Union[DCDetails, PyDetails, PyDCDetai
     }
 
 
+def test_model_schema_copy() -> None:
+    schema = model_schema(PyDetails)
+    schema["properties"].pop("name")
+    assert "name" in model_schema(PyDetails)["properties"]
+
+
 @define
 class AHeaders:
     x_info: str
@@ -150,3 +213,78 @@ def test_convert_headers(
         type_,
         exception_class=ValidationError,
     ) == type_(x_info="ABC")
+
+
+def test_convert_headers_repeated() -> None:
+    headers = Headers([("X-Info", "ABC"), ("Other", "2"), ("x-info", "DEF")])
+    assert convert_headers(headers, DCHeaders, exception_class=ValidationError) == DCHeaders(
+        x_info="ABC,DEF"
+    )
+
+
+def test_model_dump_json_native() -> None:
+    raw = {"name": "bob", "age": 2, "active": True, "score": None}
+    assert model_dump(raw) is raw
+
+
+def test_model_dump_camelize_nested() -> None:
+    assert model_dump(
+        {"first_name": "bob", "other_names": [{"last_name": "jim"}], "id": "one_two"},
+        camelize=True,
+    ) == {"firstName": "bob", "otherNames": [{"lastName": "jim"}], "id": "one_two"}
+
+
+@dataclass
+class DCName:
+    first_name: str
+    last_name: str
+
+
+@pytest.mark.parametrize(
+    "camelize, kebabize, expected",
+    [
+        (True, False, {"firstName": "bob", "lastName": "jim"}),
+        (False, True, {"first-name": "bob", "last-name": "jim"}),
+    ],
+)
+def test_model_dump_dataclass_casing(camelize: bool, kebabize: bool, expected: dict) -> None:
+    assert (
+        model_dump(
+            DCName(first_name="bob", last_name="jim"),  # type: ignore
+            camelize=camelize,
+            kebabize=kebabize,
+        )
+        == expected
+    )
+
+
+@dataclass
+class DCSecret:
+    a: int
+    secret: Annotated[str, Field(exclude=True)]
+
+
+@dataclass
+class DCSerialized:
+    n: Annotated[int, PlainSerializer(lambda value: f"#{value}", return_type=str)]
+
+
+@dataclass
+class DCTimestamp:
+    at: Annotated[datetime, PlainSerializer(lambda value: value.timestamp(), return_type=float)]
+
+
+def test_model_dump_dataclass_annotated() -> None:
+    assert model_dump(DCSecret(a=1, secret="x")) == {"a": 1}  # type: ignore
+    assert model_dump(DCSerialized(n=3)) == {"n": "#3"}  # type: ignore
+    at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert model_dump(DCTimestamp(at=at)) == {"at": at.timestamp()}  # type: ignore
+
+
+def test_model_load_decamelize_nested() -> None:
+    assert model_load(
+        [{"firstName": 1}, {"lastName": 2}],
+        List[Dict[str, int]],
+        exception_class=ValidationError,
+        decamelize=True,
+    ) == [{"first_name": 1}, {"last_name": 2}]
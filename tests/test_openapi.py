@@ -1,15 +1,19 @@
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 import pytest
 from pydantic import BaseModel, computed_field, ConfigDict, Field
 from pydantic.dataclasses import dataclass
 from quart import Quart
+from werkzeug.routing.rules import Rule
 
 from quart_schema import (
     deprecate,
+    document,
+    OpenAPIProvider,
     operation_id,
     QuartSchema,
     security_scheme,
+    tag,
     validate_headers,
     validate_querystring,
     validate_request,
@@ -92,7 +96,28 @@ async def test_openapi(type_: Type[Model], titles: bool) -> None:
 
     expected = {
         "components": {
-            "schemas": {},
+            "schemas": {
+                "Result": {
+                    "description": "Result",
+                    "properties": {"name": {"title": "Name", "type": "string"}},
+                    "required": ["name"],
+                    "title": "Result",
+                    "type": "object",
+                },
+                type_.__name__: {
+                    "properties": {
+                        "age": {
+                            "anyOf": [{"type": "integer"}, {"type": "null"}],
+                            "default": None,
+                            "title": "Age",
+                        },
+                        "name": {"title": "Name", "type": "string"},
+                    },
+                    "required": ["name"],
+                    "title": type_.__name__,
+                    "type": "object",
+                },
+            },
             "securitySchemes": {
                 "bearerAuth": {
                     "bearerFormat": "JWT",
@@ -138,13 +163,7 @@ async def test_openapi(type_: Type[Model], titles: bool) -> None:
                         "200": {
                             "content": {
                                 "application/json": {
-                                    "schema": {
-                                        "description": "Result",
-                                        "properties": {"name": {"title": "Name", "type": "string"}},
-                                        "required": ["name"],
-                                        "title": "Result",
-                                        "type": "object",
-                                    }
+                                    "schema": {"$ref": "#/components/schemas/Result"}
                                 },
                                 "headers": {
                                     "x-name": {
@@ -169,19 +188,7 @@ async def test_openapi(type_: Type[Model], titles: bool) -> None:
                     "requestBody": {
                         "content": {
                             "application/json": {
-                                "schema": {
-                                    "properties": {
-                                        "age": {
-                                            "anyOf": [{"type": "integer"}, {"type": "null"}],
-                                            "default": None,
-                                            "title": "Age",
-                                        },
-                                        "name": {"title": "Name", "type": "string"},
-                                    },
-                                    "required": ["name"],
-                                    "title": type_.__name__,
-                                    "type": "object",
-                                }
+                                "schema": {"$ref": f"#/components/schemas/{type_.__name__}"}
                             }
                         }
                     },
@@ -189,13 +196,7 @@ async def test_openapi(type_: Type[Model], titles: bool) -> None:
                         "201": {
                             "content": {
                                 "application/json": {
-                                    "schema": {
-                                        "description": "Result",
-                                        "properties": {"name": {"title": "Name", "type": "string"}},
-                                        "required": ["name"],
-                                        "title": "Result",
-                                        "type": "object",
-                                    }
+                                    "schema": {"$ref": "#/components/schemas/Result"}
                                 },
                                 "headers": {
                                     "x-name": {
@@ -216,12 +217,9 @@ async def test_openapi(type_: Type[Model], titles: bool) -> None:
         },
     }
     if not titles:
-        del expected["paths"]["/"]["post"]["requestBody"]["content"][  # type: ignore
-            "application/json"
-        ]["schema"]["properties"]["name"]["title"]
-        del expected["paths"]["/"]["post"]["requestBody"]["content"][  # type: ignore
-            "application/json"
-        ]["schema"]["properties"]["age"]["title"]
+        request_schema = expected["components"]["schemas"][type_.__name__]  # type: ignore
+        del request_schema["properties"]["name"]["title"]
+        del request_schema["properties"]["age"]["title"]
     assert result == expected
 
 
@@ -276,11 +274,34 @@ async def test_openapi_refs() -> None:
     response = await test_client.get("/openapi.json")
     schema = await response.get_json()
     ref = schema["paths"]["/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"][
-        "properties"
-    ]["resources"]["items"]["$ref"]
+        "$ref"
+    ]
+    assert ref == "#/components/schemas/Employees"
+    ref = schema["components"]["schemas"]["Employees"]["properties"]["resources"]["items"]["$ref"]
     assert ref[len("#/components/schemas/") :] in schema["components"]["schemas"].keys()
 
 
+class Manager(BaseModel):
+    first_name: str
+    contact: Dict[str, str] = Field(examples=[{"required": ["phone_number"]}])
+
+
+async def test_openapi_camelize_required() -> None:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=True)
+
+    @app.route("/")
+    @validate_response(Manager)
+    async def index() -> Manager:
+        return Manager(first_name="bob", contact={})
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = (await response.get_json())["components"]["schemas"]["Manager"]
+    assert schema["required"] == ["firstName", "contact"]
+    assert schema["properties"]["contact"]["examples"] == [{"required": ["phone_number"]}]
+
+
 class EmployeeWithComputedField(BaseModel):
     first_name: str
     last_name: str
@@ -308,9 +329,7 @@ async def test_response_model_with_computed_field() -> None:
     response = await test_client.get("/openapi.json")
     schema = await response.get_json()
 
-    response_properties = schema["paths"]["/"]["get"]["responses"]["200"]["content"][
-        "application/json"
-    ]["schema"]["properties"]
+    response_properties = schema["components"]["schemas"]["EmployeeWithComputedField"]["properties"]
 
     assert "firstName" in response_properties
     assert "lastName" in response_properties
@@ -336,8 +355,162 @@ async def test_model_with_example() -> None:
     response = await test_client.get("/openapi.json")
     schema = await response.get_json()
 
-    properties = schema["paths"]["/"]["post"]["requestBody"]["content"]["application/json"][
-        "schema"
-    ]
+    properties = schema["components"]["schemas"]["Example"]
 
     assert properties["examples"] == [{"a": "Foo"}]
+
+
+async def test_openapi_schema_cached() -> None:
+    app = Quart(__name__)
+    extension = QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(Result)
+    async def index() -> Result:
+        return Result(name="bob")
+
+    calls = 0
+    schema = extension.openapi_provider.schema
+
+    def _counting_schema() -> Dict:
+        nonlocal calls
+        calls += 1
+        return schema()
+
+    extension.openapi_provider.schema = _counting_schema  # type: ignore[method-assign]
+
+    test_client = app.test_client()
+    first = await (await test_client.get("/openapi.json")).get_json()
+    second = await (await test_client.get("/openapi.json")).get_json()
+    assert first == second
+    assert calls == 1
+
+
+async def test_openapi_etag() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    assert response.status_code == 200
+    assert response.content_type == "application/json"
+    etag = response.headers["ETag"]
+
+    response = await test_client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+async def test_openapi_model_components() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.post("/")
+    @validate_request(EmployeeWithComputedField)
+    @validate_response(EmployeeWithComputedField)
+    async def create(data: EmployeeWithComputedField) -> EmployeeWithComputedField:
+        return data
+
+    @app.get("/other")
+    @validate_response(Result)
+    async def other() -> Result:
+        return Result(name="bob")
+
+    @app.get("/another")
+    @validate_response(Result)
+    async def another() -> Result:
+        return Result(name="bob")
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = await response.get_json()
+
+    ref = {"$ref": "#/components/schemas/Result"}
+    for path in ["/other", "/another"]:
+        responses = schema["paths"][path]["get"]["responses"]
+        assert responses["200"]["content"]["application/json"]["schema"] == ref
+
+    # The serialization schema differs from the validation schema, so
+    # it cannot share the component.
+    operation = schema["paths"]["/"]["post"]
+    request_schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert request_schema == {"$ref": "#/components/schemas/EmployeeWithComputedField"}
+    response_schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    assert "full_name" in response_schema["properties"]
+
+
+async def test_document() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.post("/")
+    @document(
+        querystring=QueryItem,
+        request=PyDetails,
+        responses={200: (Result, None), 201: (Result, None)},
+    )
+    async def index() -> str:
+        return ""
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    path = (await response.get_json())["paths"]["/"]["post"]
+    assert path["parameters"][0]["name"] == "count_le"
+    assert "requestBody" in path
+    assert set(path["responses"]) == {"200", "201"}
+
+
+async def test_tag_order() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.get("/")
+    @tag(["b", "a", "b", "c"])
+    async def index() -> str:
+        return ""
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    assert (await response.get_json())["paths"]["/"]["get"]["tags"] == ["b", "a", "c"]
+
+
+class NoOperationIdProvider(OpenAPIProvider):
+    def operation_id(self, method: str, func: Callable) -> Optional[str]:
+        return None
+
+
+async def test_operation_per_method() -> None:
+    app = Quart(__name__)
+    QuartSchema(app, openapi_provider_class=NoOperationIdProvider)
+
+    @app.route("/", methods=["GET", "POST"])
+    async def index() -> str:
+        return ""
+
+    schema = app.extensions["QUART_SCHEMA"].openapi_provider.schema()
+    schema["paths"]["/"]["get"]["summary"] = "Get"
+    assert "summary" not in schema["paths"]["/"]["post"]
+
+
+class PathParametersProvider(OpenAPIProvider):
+    def build_paths(self, rule: Rule) -> Tuple[dict, dict]:
+        paths, components = super().build_paths(rule)
+        for path_object in paths.values():
+            path_object["parameters"] = []
+            path_object["post"] = {"summary": "No responses"}
+        return paths, components
+
+
+async def test_path_level_fields() -> None:
+    app = Quart(__name__)
+    QuartSchema(app, openapi_provider_class=PathParametersProvider)
+
+    @app.route("/")
+    @validate_response(Result)
+    async def index() -> Result:
+        return Result(name="bob")
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = await response.get_json()
+    assert schema["paths"]["/"]["parameters"] == []
+    assert "Result" in schema["components"]["schemas"]
@@ -1,3 +1,4 @@
+import json
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Annotated, Any, List, Literal, Optional, Tuple, Type, TypeVar, Union
@@ -10,11 +11,13 @@ from pydantic.dataclasses import dataclass as pydantic_dataclass
 from pydantic.functional_validators import BeforeValidator
 from quart import Quart, redirect, Response, websocket
 from quart.datastructures import FileStorage
+from quart.json.provider import DefaultJSONProvider
 from quart.views import View
 
 from quart_schema import (
     DataSource,
     QuartSchema,
+    RequestSchemaValidationError,
     ResponseReturnValue,
     SchemaValidationError,
     validate_headers,
@@ -104,6 +107,57 @@ async def test_request_validation(
     assert response.status_code == status
 
 
+@pytest.mark.parametrize("type_", [AItem, DCItem, MItem, PyItem, PyDCItem])
+@pytest.mark.parametrize(
+    "body, status",
+    [
+        (b'{"count": 2, "details": {"name": "bob"}}', 200),
+        (b'{"count": 2, "name": "bob"}', 422),
+        (b'{"count": 2,', 400),
+    ],
+)
+async def test_request_json_errors(
+    type_: Type[Union[AItem, DCItem, MItem, PyItem, PyDCItem]],
+    body: bytes,
+    status: int,
+) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.errorhandler(RequestSchemaValidationError)
+    async def handle_request_validation_error(error: RequestSchemaValidationError) -> Any:
+        return "", 422
+
+    @app.route("/", methods=["POST"])
+    @validate_request(type_)
+    async def item(data: Any) -> ResponseReturnValue:
+        return ""
+
+    test_client = app.test_client()
+    response = await test_client.post("/", data=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == status
+
+
+async def test_request_json_provider() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    class Provider(DefaultJSONProvider):
+        def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+            return {**super().loads(s, **kwargs), "count": 3}
+
+    app.json = Provider(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(PyItem)
+    async def item(data: PyItem) -> ResponseReturnValue:
+        return str(data.count)
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json=VALID_DICT)
+    assert (await response.get_data(as_text=True)) == "3"
+
+
 @pytest.mark.parametrize("type_", [ADetails, DCDetails, MDetails, PyDetails, PyDCDetails])
 @pytest.mark.parametrize(
     "data, status",
@@ -262,6 +316,22 @@ async def test_response_validation_of_response() -> None:
     assert response.status_code == 500
 
 
+async def test_sync_route_validation() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.post("/")
+    @validate_request(PyItem)
+    @validate_response(PyItem)
+    def item(data: PyItem) -> PyItem:
+        return data
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json=VALID_DICT)
+    assert response.status_code == 200
+    assert (await response.get_json()) == {"count": 2, "details": {"name": "bob", "age": None}}
+
+
 @pytest.mark.parametrize(
     "return_value, status",
     [
@@ -307,6 +377,28 @@ async def test_websocket_validation(
     async with test_client.websocket("/ws") as test_websocket:
         await test_websocket.send_json(VALID_DICT)
         await test_websocket.send_json(INVALID_DICT)
+        data = await test_websocket.receive()
+        assert data == '{"count": 2, "details": {"age": null, "name": "bob"}}'
+        assert json.loads(data) == {"count": 2, "details": {"name": "bob", "age": None}}
+
+
+@pytest.mark.parametrize("type_", [AItem, DCItem, MItem, PyItem, PyDCItem])
+async def test_websocket_invalid_json(
+    type_: Type[Union[AItem, DCItem, MItem, PyItem, PyDCItem]],
+) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.websocket("/ws")
+    async def ws() -> None:
+        with pytest.raises(json.JSONDecodeError):
+            await websocket.receive_as(type_)  # type: ignore
+        await websocket.send("done")
+
+    test_client = app.test_client()
+    async with test_client.websocket("/ws") as test_websocket:
+        await test_websocket.send('{"count": 2,')
+        assert (await test_websocket.receive()) == "done"
 
 
 @pytest.mark.parametrize(